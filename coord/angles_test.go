@@ -61,14 +61,13 @@ func TestSeparationAngle_Golden(t *testing.T) {
 	var golden goldenSeparation
 	loadJSON(t, "../testdata/golden_separation.json", &golden)
 
-	// Load SPK position data to get the actual vectors
-	type spkEntry struct {
-		TDBJD  float64    `json:"tdb_jd"`
-		BodyID int        `json:"body_id"`
-		PosKm  [3]float64 `json:"pos_km"`
-	}
+	// Load SPK position data to get the actual vectors (stored column-wise)
 	var spkData struct {
-		Tests []spkEntry `json:"tests"`
+		TDBJD  []float64 `json:"tdb_jd"`
+		BodyID []int     `json:"body_id"`
+		XKm    []float64 `json:"x_km"`
+		YKm    []float64 `json:"y_km"`
+		ZKm    []float64 `json:"z_km"`
 	}
 	loadJSON(t, "../testdata/golden_spk.json", &spkData)
 
@@ -78,8 +77,8 @@ func TestSeparationAngle_Golden(t *testing.T) {
 		bodyID int
 	}
 	posMap := make(map[key][3]float64)
-	for _, e := range spkData.Tests {
-		posMap[key{e.TDBJD, e.BodyID}] = e.PosKm
+	for i, tdb := range spkData.TDBJD {
+		posMap[key{tdb, spkData.BodyID[i]}] = [3]float64{spkData.XKm[i], spkData.YKm[i], spkData.ZKm[i]}
 	}
 
 	const tol = 1e-8 // degrees; should match nearly exactly since same positions
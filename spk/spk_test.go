@@ -12,13 +12,25 @@ import (
 
 const bspPath = "../data/de440s.bsp"
 
-// goldenSPK matches the JSON structure in testdata/golden_spk.json.
+// goldenSPK holds the test cases from testdata/golden_spk.json.
 type goldenSPK struct {
-	Tests []struct {
-		TDBJD  float64    `json:"tdb_jd"`
-		BodyID int        `json:"body_id"`
-		PosKm  [3]float64 `json:"pos_km"`
-	} `json:"tests"`
+	Tests []goldenSPKTest
+}
+
+type goldenSPKTest struct {
+	TDBJD  float64
+	BodyID int
+	PosKm  [3]float64
+}
+
+// goldenSPKColumns matches the JSON structure in testdata/golden_spk.json,
+// which stores one array per field; row i of every array is one test case.
+type goldenSPKColumns struct {
+	TDBJD  []float64 `json:"tdb_jd"`
+	BodyID []int     `json:"body_id"`
+	XKm    []float64 `json:"x_km"`
+	YKm    []float64 `json:"y_km"`
+	ZKm    []float64 `json:"z_km"`
 }
 
 func loadGoldenSPK(t *testing.T) goldenSPK {
@@ -27,10 +39,22 @@ func loadGoldenSPK(t *testing.T) goldenSPK {
 	if err != nil {
 		t.Fatal(err)
 	}
-	var g goldenSPK
-	if err := json.Unmarshal(data, &g); err != nil {
+	var cols goldenSPKColumns
+	if err := json.Unmarshal(data, &cols); err != nil {
 		t.Fatal(err)
 	}
+	n := len(cols.TDBJD)
+	if len(cols.BodyID) != n || len(cols.XKm) != n || len(cols.YKm) != n || len(cols.ZKm) != n {
+		t.Fatal("golden_spk.json: columns have different lengths")
+	}
+	g := goldenSPK{Tests: make([]goldenSPKTest, n)}
+	for i := range g.Tests {
+		g.Tests[i] = goldenSPKTest{
+			TDBJD:  cols.TDBJD[i],
+			BodyID: cols.BodyID[i],
+			PosKm:  [3]float64{cols.XKm[i], cols.YKm[i], cols.ZKm[i]},
+		}
+	}
 	return g
 }
 
@@ -8,11 +8,12 @@ over the full DE440s range (1850-2149).
 Usage:
     python3 generate_golden.py
 
-Requires: skyfield, numpy
+Requires: skyfield, numpy, orjson
 BSP file: ../data/de440s.bsp (de440s covers 1849-2150)
 """
 
-import json
+import functools
+import multiprocessing
 import os
 import sys
 import math
@@ -21,7 +22,7 @@ from datetime import datetime, timedelta, timezone
 
 # Use the anaconda python if skyfield isn't found in default
 try:
-    from skyfield.api import load, Star, Angle, N, W, wgs84
+    from skyfield.api import load, Star, N, W, wgs84
     from skyfield.earthlib import earth_rotation_angle, refraction
     from skyfield.timelib import tdb_minus_tt
     from skyfield.functions import angle_between, length_of, rot_y, rot_z, mxm, mxv, to_spherical
@@ -30,6 +31,12 @@ except ImportError:
     print("skyfield not found. Install with: pip install skyfield")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    print("orjson not found. Install with: pip install orjson")
+    sys.exit(1)
+
 # --- Configuration ---
 
 BSP_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'de440s.bsp')
@@ -39,6 +46,8 @@ OUTPUT_DIR = os.path.dirname(__file__)
 REF_DATE = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
 YEARS_RANGE = 200  # -200 to +200 years (clamped to BSP range 1850-2149)
 DAY_INCREMENT = 30
+# Dates per worker task; bounds the per-task memory regardless of core count
+SHARD_DATES = 100
 
 # de440s covers 1849-2150, so clamp to safe range
 EARLIEST = datetime(1850, 1, 1, tzinfo=timezone.utc)
@@ -74,7 +83,12 @@ GC_DEC_DEG = -(29.0 + 0.0/60.0 + 28.118/3600.0)
 
 
 def generate_dates():
-    """Generate dates at 30-day increments, clamped to BSP range."""
+    """Return the start date and the day offsets of dates at 30-day increments.
+
+    The range is clamped to the BSP coverage. Dates are evenly spaced, so they
+    are represented as integer day offsets from the start rather than as a
+    list of datetimes.
+    """
     start = REF_DATE - timedelta(days=YEARS_RANGE * 365)
     end = REF_DATE + timedelta(days=YEARS_RANGE * 365)
 
@@ -84,32 +98,152 @@ def generate_dates():
     if end > LATEST:
         end = LATEST
 
-    dates = []
-    d = start
-    while d <= end:
-        dates.append(d)
-        d += timedelta(days=DAY_INCREMENT)
-    return dates
+    n_dates = (end - start) // timedelta(days=DAY_INCREMENT) + 1
+    return start, np.arange(n_dates) * DAY_INCREMENT
 
 
 def mean_lunar_node_longitude(tt_jd):
-    """Mean North Node ecliptic longitude (degrees) using Meeus formula."""
-    T = (tt_jd - 2451545.0) / 36525.0
-    omega = 125.04452 - 1934.136261 * T + 0.0020708 * T**2 + T**3 / 450000.0
-    return omega % 360.0
-
+    """Mean North Node ecliptic longitude (degrees) using Meeus formula.
 
-def main():
-    print(f"Loading ephemeris: {BSP_PATH}")
+    tt_jd is an array of TT Julian dates; the cubic is evaluated in
+    Horner form over the whole array.
+    """
+    T = (tt_jd - 2451545.0) / 36525.0
+    omega = ((T / 450000.0 + 0.0020708) * T - 1934.136261) * T + 125.04452
+    return np.mod(omega, 360.0)
+
+
+def encode_entry(entry):
+    """Serialize one test entry as a JSON object."""
+    return orjson.dumps(entry, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def encode_entries(entries):
+    """Serialize test entries as (count, comma-separated JSON objects)."""
+    body = b','.join(encode_entry(entry) for entry in entries)
+    return len(entries), body
+
+
+class JsonArrayWriter:
+    """Stream a golden JSON file to disk one test entry at a time.
+
+    The header fields and the opening of the "tests" array are written on
+    construction, append()/append_encoded() add entries, and close()
+    finishes the document, so no file is ever held in memory as a list of
+    dicts. Entries stream to a .tmp file; replace() then moves it over the
+    golden file, so a failed run leaves the checked-in file untouched.
+    """
+
+    def __init__(self, filename, **header):
+        self.filename = filename
+        self.path = os.path.join(OUTPUT_DIR, filename)
+        self.tmp_path = self.path + '.tmp'
+        self.count = 0
+        self.f = open(self.tmp_path, 'wb')
+        prefix = orjson.dumps(header)[1:-1]
+        self.f.write(b'{' + prefix + (b',' if prefix else b'') + b'"tests":[')
+
+    def append(self, entry):
+        self.append_encoded(*encode_entries([entry]))
+
+    def append_encoded(self, count, body):
+        """Append entries already serialized by encode_entries()."""
+        if not count:
+            return
+        if self.count:
+            self.f.write(b',')
+        self.f.write(body)
+        self.count += count
+
+    def close(self):
+        """Finish the .tmp file and sync it to disk."""
+        self.f.write(b']}')
+        self.f.flush()
+        os.fsync(self.f.fileno())
+        self.f.close()
+        size_mb = os.path.getsize(self.tmp_path) / (1024 * 1024)
+        print(f"  {self.filename}: {self.count} entries, {size_mb:.1f} MB")
+
+    def replace(self):
+        """Move the finished .tmp file over the golden file."""
+        os.replace(self.tmp_path, self.path)
+
+    def discard(self):
+        """Drop the partial output, leaving the golden file as it was."""
+        if not self.f.closed:
+            self.f.close()
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+
+class JsonColumnsWriter:
+    """Collect a column-oriented golden JSON file and write it on close().
+
+    Like JsonArrayWriter, close() writes a .tmp file and replace() moves it
+    over the golden file.
+
+    Used for the large fixed-schema tables: instead of a "tests" array of
+    objects repeating every key, each field is a top-level array after the
+    header fields, and row i of every array forms one test case.
+    """
+
+    def __init__(self, filename, **header):
+        self.filename = filename
+        self.path = os.path.join(OUTPUT_DIR, filename)
+        self.tmp_path = self.path + '.tmp'
+        self.header = header
+        self.chunks = {}
+        self.count = 0
+
+    def append_columns(self, columns):
+        """Append rows given as a dict of equal-length column arrays."""
+        for name, values in columns.items():
+            self.chunks.setdefault(name, []).append(values)
+        self.count += len(next(iter(columns.values())))
+
+    def close(self):
+        data = dict(self.header)
+        for name, chunks in self.chunks.items():
+            data[name] = np.concatenate(chunks).tolist()
+        with open(self.tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+        size_mb = os.path.getsize(self.tmp_path) / (1024 * 1024)
+        print(f"  {self.filename}: {self.count} rows, {size_mb:.1f} MB")
+
+    def replace(self):
+        """Move the finished .tmp file over the golden file."""
+        os.replace(self.tmp_path, self.path)
+
+    def discard(self):
+        """Drop the collected rows, leaving the golden file as it was."""
+        self.chunks = {}
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+
+def compute_shard(start, day_offsets):
+    """Compute the date-based golden entries for one contiguous shard of dates.
+
+    The shard's dates are start + day_offsets (in days).
+
+    Runs in a worker process, so it loads its own ephemeris and timescale
+    (the BSP file is memory-mapped). Returns a dict mapping each output key
+    to its entries in date order: row-oriented files as (count, bytes) in
+    the encode_entries() format, so only bytes travel back to the parent,
+    column-oriented files (spk, ecliptic) as a dict of column arrays.
+    """
     ephem = load(BSP_PATH)
     ts = load.timescale()
     earth = ephem['earth']
+    sun_body = ephem['sun']
+
+    # Resolve each body's segment chain once
+    body_objs = [(body_name, ephem[sf_key], naif_id) for body_name, sf_key, naif_id in BODIES]
 
     # Galactic Center star object
-    gc_star = Star(
-        ra=Angle(hours=GC_RA_HOURS),
-        dec=Angle(degrees=GC_DEC_DEG),
-    )
+    gc_star = Star(ra_hours=GC_RA_HOURS, dec_degrees=GC_DEC_DEG)
 
     # Build location objects
     skyfield_locations = []
@@ -117,13 +251,9 @@ def main():
         loc = earth + wgs84.latlon(lat, lon)
         skyfield_locations.append((name, lat, lon, loc))
 
-    dates = generate_dates()
-    print(f"Generating golden data for {len(dates)} dates...")
+    n_dates = len(day_offsets)
 
-    # --- Golden SPK data (body positions) ---
-    spk_tests = []
-    # --- Golden coord data (ecliptic lat/lon) ---
-    ecliptic_tests = []
+    # Row-oriented files collect their entries already encoded (encode_entry)
     # --- Golden timescale data ---
     timescale_tests = []
     # --- Golden location data ---
@@ -146,314 +276,380 @@ def main():
     # Bodies for altaz tests: Sun, Moon, Mars
     ALTAZ_BODY_IDS = {10, 301, 4}
 
-    for i, d in enumerate(dates):
-        t = ts.from_datetime(d)
-        tt_jd = t.tt
-        ut1_jd = t.ut1
-
-        # Timescale: record UTC JD, TT JD, UT1 JD
-        # UTC JD: compute from the datetime
-        unix_sec = d.timestamp()
-        utc_jd = unix_sec / 86400.0 + 2440587.5
-        timescale_tests.append({
-            "utc_jd": utc_jd,
-            "tt_jd": tt_jd,
-            "ut1_jd": ut1_jd,
-        })
-
-        # GMST
-        sidereal_tests.append({
-            "ut1_jd": ut1_jd,
-            "gmst_deg": t.gmst * 15.0,  # Skyfield returns hours, convert to degrees
-        })
-
-        # Body positions
-        for body_name, sf_key, naif_id in BODIES:
-            body = ephem[sf_key]
-            astrometric = earth.at(t).observe(body)
-            pos_km = astrometric.position.km
-            eclip = astrometric.ecliptic_latlon()
-            ecl_lat = eclip[0].degrees
-            ecl_lon = eclip[1]._degrees % 360.0
-
-            spk_tests.append({
-                "tdb_jd": tt_jd,  # TDB ≈ TT
-                "body_id": naif_id,
-                "pos_km": [float(pos_km[0]), float(pos_km[1]), float(pos_km[2])],
-            })
-
-            ecliptic_tests.append({
-                "tdb_jd": tt_jd,
-                "body_name": body_name,
-                "body_id": naif_id,
-                "ecl_lat_deg": float(ecl_lat),
-                "ecl_lon_deg": float(ecl_lon),
-            })
-
+    # The shard's dates are evaluated as one array-valued Time, so Skyfield runs
+    # precession/nutation and every observe() once per body rather than once
+    # per (date, body). Results are (N,) or (3, N) arrays, serialized below.
+    t = ts.utc(start.year, start.month, start.day + day_offsets,
+               start.hour, start.minute, start.second + start.microsecond / 1e6)
+    tt_jd = t.tt
+    ut1_jd = t.ut1
+
+    # Timescale: UTC JD computed from the Unix time of each date
+    unix_sec = start.timestamp() + day_offsets * 86400.0
+    utc_jd = unix_sec / 86400.0 + 2440587.5
+
+    # GMST: Skyfield returns hours, convert to degrees
+    gmst_deg = t.gmst * 15.0
+
+    # --- Tier 1: ERA (Skyfield returns turns, convert to degrees) and TDB-TT ---
+    era_deg = earth_rotation_angle(ut1_jd) * 360.0
+    tdbtt_sec = tdb_minus_tt(tt_jd)
+
+    # Lunar nodes
+    nn_lon = mean_lunar_node_longitude(tt_jd)
+    sn_lon = (nn_lon + 180.0) % 360.0
+
+    # Observer state and Earth orientation shared by every target below
+    earth_at_t = earth.at(t)
+    R_itrs = itrs.rotation_at(t)
+
+    # Tier 2: Altaz rotation (GCRS -> local horizon) for each location. These
+    # depend only on the location and t, so build them once and share them
+    # across the altaz bodies.
+    altaz_rotations = []
+    for loc_name, lat, lon, loc_obj in skyfield_locations:
+        R_lat = rot_y(np.radians(lat))[::-1]
+        R_latlon = mxm(R_lat, rot_z(-np.radians(lon)))
+        altaz_rotations.append((loc_name, lat, lon, mxm(R_latlon, R_itrs)))
+
+    # Body positions
+    # Astrometric results and ecliptic longitudes are kept by NAIF ID so the
+    # phase, separation and elongation sections below reuse them.
+    astros = {}
+    ecl_lons = {}
+    body_results = []
+    for body_name, body, naif_id in body_objs:
+        astrometric = earth_at_t.observe(body)
+        astros[naif_id] = astrometric
+        eclip = astrometric.ecliptic_latlon()
+        ecl_lons[naif_id] = np.mod(eclip[1].degrees, 360.0)
+
+        # Tier 2: Apparent position (km)
+        app_km = astrometric.apparent().position.km
+
+        # Tier 2: Altaz — apply Skyfield's rotation to geocentric apparent position
+        altaz = []
+        if naif_id in ALTAZ_BODY_IDS:
+            for loc_name, lat, lon, R in altaz_rotations:
+                pos_local = mxv(R, app_km)
+                r, alt_rad, az_rad = to_spherical(pos_local)
+                altaz.append((loc_name, lat, lon, np.degrees(alt_rad), np.degrees(az_rad), r))
+
+        body_results.append({
+            "body_name": body_name,
+            "body_id": naif_id,
+            "pos_km": astrometric.position.km,
+            "ecl_lat_deg": eclip[0].degrees,
+            "ecl_lon_deg": ecl_lons[naif_id],
             # Tier 2: Velocity (km/day)
-            vel_km_s = astrometric.velocity.km_per_s
-            velocity_tests.append({
-                "tdb_jd": tt_jd,
-                "body_id": naif_id,
-                "vel_km_day": [float(v * 86400) for v in vel_km_s],
-            })
-
-            # Tier 2: Apparent position (km)
-            apparent = astrometric.apparent()
-            app_km = apparent.position.km
-            apparent_tests.append({
-                "tdb_jd": tt_jd,
-                "body_id": naif_id,
-                "pos_km": [float(app_km[0]), float(app_km[1]), float(app_km[2])],
-            })
-
-            # Tier 2: Altaz — apply Skyfield's rotation to geocentric apparent position
-            if naif_id in ALTAZ_BODY_IDS:
-                app_km_arr = np.array(app_km)
-                R_itrs = itrs.rotation_at(t)
-                for loc_name, lat, lon, loc_obj in skyfield_locations:
-                    R_lat = rot_y(np.radians(lat))[::-1]
-                    R_latlon = mxm(R_lat, rot_z(-np.radians(lon)))
-                    R = mxm(R_latlon, R_itrs)
-                    pos_local = mxv(R, app_km_arr)
-                    r, alt_rad, az_rad = to_spherical(pos_local)
-                    altaz_tests.append({
-                        "tdb_jd": tt_jd,
-                        "ut1_jd": ut1_jd,
-                        "body_id": naif_id,
-                        "loc_name": loc_name,
-                        "lat": lat,
-                        "lon": lon,
-                        "alt_deg": float(np.degrees(alt_rad)),
-                        "az_deg": float(np.degrees(az_rad)),
-                        "dist_km": float(r),
-                    })
-
-        # Galactic Center
-        gc_obs = earth.at(t).observe(gc_star)
-        gc_eclip = gc_obs.ecliptic_latlon()
-        ecliptic_tests.append({
-            "tdb_jd": tt_jd,
-            "body_name": "gc",
-            "body_id": 0,
-            "ecl_lat_deg": float(gc_eclip[0].degrees),
-            "ecl_lon_deg": float(gc_eclip[1]._degrees % 360.0),
+            "vel_km_day": (astrometric.velocity.km_per_s * 86400).T.tolist(),
+            "app_km": app_km.T.tolist(),
+            "altaz": altaz,
         })
 
-        # Locations
-        for loc_name, lat, lon, loc_obj in skyfield_locations:
-            obs = earth.at(t).observe(loc_obj)
-            eclip = obs.ecliptic_latlon()
-            location_tests.append({
-                "tdb_jd": tt_jd,
-                "ut1_jd": ut1_jd,
+    # Galactic Center: one array-valued observe() covers every date in the shard
+    gc_obs = earth_at_t.observe(gc_star)
+    gc_eclip = gc_obs.ecliptic_latlon()
+    gc_lat = gc_eclip[0].degrees
+    gc_lon = np.mod(gc_eclip[1].degrees, 360.0)
+
+    # Locations
+    location_results = []
+    for loc_name, lat, lon, loc_obj in skyfield_locations:
+        obs = earth_at_t.observe(loc_obj)
+        eclip = obs.ecliptic_latlon()
+        location_results.append((loc_name, lat, lon, eclip[0].degrees, np.mod(eclip[1].degrees, 360.0)))
+
+    # --- Tier 1: Phase angle, fraction illuminated, separation, elongation ---
+    # Use Sun, Moon, and a few planets for phase/separation/elongation tests
+    sun_astrometric = astros[10]
+    moon_astrometric = astros[301]
+
+    # Phase angle for Moon (Sun-Moon-Earth angle) and planets
+    # (Mercury, Venus, Mars, Jupiter, Saturn).
+    # Include the exact vectors Skyfield uses internally so Go test can validate
+    # PhaseAngle() as a pure function without SPK reconstruction errors.
+    # Skyfield's phase_angle: u = obs_to_target, v = u - sun_ssb + earth_ssb = sun_to_target
+    sun_at_t = sun_body.at(t)
+    phase_astrometrics = [("moon", moon_astrometric)]
+    for body_name, _, naif_id in body_objs:
+        if naif_id in (199, 299, 4, 5, 6):  # Mercury, Venus, Mars, Jupiter, Saturn
+            phase_astrometrics.append((body_name, astros[naif_id]))
+
+    phase_results = []
+    for body_name, body_astrometric in phase_astrometrics:
+        pa = body_astrometric.phase_angle(sun_body).degrees
+        fi = body_astrometric.fraction_illuminated(sun_body)
+        u = body_astrometric.position.km
+        v = u - sun_at_t.position.km + earth_at_t.position.km
+        phase_results.append((body_name, pa, fi, u.T.tolist(), v.T.tolist()))
+
+    # Separation angle: Sun-Moon, one batched angle_between() over (3, N) arrays
+    sep_sun_moon = np.degrees(angle_between(sun_astrometric.position.au,
+                                            moon_astrometric.position.au))
+
+    # Moon elongation (ecliptic longitude difference Moon - Sun)
+    sun_ecl_lon = ecl_lons[10]
+    moon_ecl_lon = ecl_lons[301]
+    elong = (moon_ecl_lon - sun_ecl_lon) % 360.0
+
+    # --- Golden SPK and ecliptic data, column-oriented ---
+    # Rows are date-major (every body for a date, then the next date), so each
+    # column is an (N, bodies) array flattened in C order.
+    body_ids = [body["body_id"] for body in body_results]
+    spk_columns = {
+        "tdb_jd": np.repeat(tt_jd, len(body_results)),  # TDB ≈ TT
+        "body_id": np.tile(body_ids, n_dates),
+        "x_km": np.stack([body["pos_km"][0] for body in body_results], axis=1).ravel(),
+        "y_km": np.stack([body["pos_km"][1] for body in body_results], axis=1).ravel(),
+        "z_km": np.stack([body["pos_km"][2] for body in body_results], axis=1).ravel(),
+    }
+
+    # Ecliptic rows also include the Galactic Center after the bodies
+    ecl_names = [body["body_name"] for body in body_results] + ["gc"]
+    ecliptic_columns = {
+        "tdb_jd": np.repeat(tt_jd, len(ecl_names)),
+        "body_name": np.tile(ecl_names, n_dates),
+        "body_id": np.tile(body_ids + [0], n_dates),
+        "ecl_lat_deg": np.stack([body["ecl_lat_deg"] for body in body_results] + [gc_lat], axis=1).ravel(),
+        "ecl_lon_deg": np.stack([body["ecl_lon_deg"] for body in body_results] + [gc_lon], axis=1).ravel(),
+    }
+
+    # Emit one entry per date, keeping the date-major ordering of the files.
+    # Entries are encoded as they are produced, so the shard only ever holds
+    # their bytes.
+    for i in range(n_dates):
+        timescale_tests.append(encode_entry({
+            "utc_jd": utc_jd[i],
+            "tt_jd": tt_jd[i],
+            "ut1_jd": ut1_jd[i],
+        }))
+
+        sidereal_tests.append(encode_entry({
+            "ut1_jd": ut1_jd[i],
+            "gmst_deg": gmst_deg[i],
+        }))
+
+        for body in body_results:
+            velocity_tests.append(encode_entry({
+                "tdb_jd": tt_jd[i],
+                "body_id": body["body_id"],
+                "vel_km_day": body["vel_km_day"][i],
+            }))
+
+            apparent_tests.append(encode_entry({
+                "tdb_jd": tt_jd[i],
+                "body_id": body["body_id"],
+                "pos_km": body["app_km"][i],
+            }))
+
+            for loc_name, lat, lon, alt_deg, az_deg, dist_km in body["altaz"]:
+                altaz_tests.append(encode_entry({
+                    "tdb_jd": tt_jd[i],
+                    "ut1_jd": ut1_jd[i],
+                    "body_id": body["body_id"],
+                    "loc_name": loc_name,
+                    "lat": lat,
+                    "lon": lon,
+                    "alt_deg": alt_deg[i],
+                    "az_deg": az_deg[i],
+                    "dist_km": dist_km[i],
+                }))
+
+        for loc_name, lat, lon, ecl_lat, ecl_lon in location_results:
+            location_tests.append(encode_entry({
+                "tdb_jd": tt_jd[i],
+                "ut1_jd": ut1_jd[i],
                 "loc_name": loc_name,
                 "lat": lat,
                 "lon": lon,
-                "ecl_lat_deg": float(eclip[0].degrees),
-                "ecl_lon_deg": float(eclip[1]._degrees % 360.0),
-            })
-
-        # Lunar nodes
-        nn_lon = mean_lunar_node_longitude(tt_jd)
-        sn_lon = (nn_lon + 180.0) % 360.0
-        lunarnode_tests.append({
-            "tdb_jd": tt_jd,
-            "north_node_lon_deg": nn_lon,
-            "south_node_lon_deg": sn_lon,
-        })
-
-        # --- Tier 1: ERA ---
-        era_val = earth_rotation_angle(ut1_jd) * 360.0  # Skyfield returns turns, convert to degrees
-        era_tests.append({
-            "ut1_jd": ut1_jd,
-            "era_deg": float(era_val),
-        })
-
-        # --- Tier 1: TDB-TT ---
-        tdbtt_val = tdb_minus_tt(tt_jd)
-        tdbtt_tests.append({
-            "tt_jd": tt_jd,
-            "tdb_minus_tt_sec": float(tdbtt_val),
-        })
-
-        # --- Tier 1: Phase angle, fraction illuminated, separation, elongation ---
-        # Use Sun, Moon, and a few planets for phase/separation/elongation tests
-        sun_body = ephem['sun']
-        moon_body = ephem['moon']
-
-        # Observe all bodies from Earth for this date
-        sun_astrometric = earth.at(t).observe(sun_body)
-        moon_astrometric = earth.at(t).observe(moon_body)
-
-        # Sun and Moon positions in km (observer-to-target vectors)
-        sun_pos_km = sun_astrometric.position.km
-        moon_pos_km = moon_astrometric.position.km
-
-        # Phase angle for Moon (Sun-Moon-Earth angle)
-        # Include the exact vectors Skyfield uses internally so Go test can validate
-        # PhaseAngle() as a pure function without SPK reconstruction errors.
-        # Skyfield's phase_angle: u = obs_to_target, v = u - sun_ssb + earth_ssb = sun_to_target
-        moon_phase_angle = moon_astrometric.phase_angle(sun_body).degrees
-        moon_frac = moon_astrometric.fraction_illuminated(sun_body)
-        sun_at_t = sun_body.at(t)
-        earth_bary = earth.at(t)
-        moon_u = moon_astrometric.position.km
-        moon_v = moon_u - sun_at_t.position.km + earth_bary.position.km
-
-        phase_tests.append({
-            "tdb_jd": tt_jd,
-            "body_name": "moon",
-            "phase_angle_deg": float(moon_phase_angle),
-            "fraction_illuminated": float(moon_frac),
-            "obs_to_target_km": [float(x) for x in moon_u],
-            "sun_to_target_km": [float(x) for x in moon_v],
-        })
-
-        # Phase angle for planets (Mercury, Venus, Mars, Jupiter, Saturn)
-        for body_name, sf_key, naif_id in BODIES:
-            if naif_id in (199, 299, 4, 5, 6):  # Mercury, Venus, Mars, Jupiter, Saturn
-                body = ephem[sf_key]
-                body_astrometric = earth.at(t).observe(body)
-                pa = body_astrometric.phase_angle(sun_body).degrees
-                fi = body_astrometric.fraction_illuminated(sun_body)
-                u = body_astrometric.position.km
-                v = u - sun_at_t.position.km + earth_bary.position.km
-                phase_tests.append({
-                    "tdb_jd": tt_jd,
-                    "body_name": body_name,
-                    "phase_angle_deg": float(pa),
-                    "fraction_illuminated": float(fi),
-                    "obs_to_target_km": [float(x) for x in u],
-                    "sun_to_target_km": [float(x) for x in v],
-                })
-
-        # Separation angle: Sun-Moon
-        sun_pos_au = np.array(sun_astrometric.position.au)
-        moon_pos_au = np.array(moon_astrometric.position.au)
-        sep_sun_moon = float(np.degrees(angle_between(sun_pos_au, moon_pos_au)))
-        separation_tests.append({
-            "tdb_jd": tt_jd,
+                "ecl_lat_deg": ecl_lat[i],
+                "ecl_lon_deg": ecl_lon[i],
+            }))
+
+        lunarnode_tests.append(encode_entry({
+            "tdb_jd": tt_jd[i],
+            "north_node_lon_deg": nn_lon[i],
+            "south_node_lon_deg": sn_lon[i],
+        }))
+
+        era_tests.append(encode_entry({
+            "ut1_jd": ut1_jd[i],
+            "era_deg": era_deg[i],
+        }))
+
+        tdbtt_tests.append(encode_entry({
+            "tt_jd": tt_jd[i],
+            "tdb_minus_tt_sec": tdbtt_sec[i],
+        }))
+
+        for body_name, pa, fi, u, v in phase_results:
+            phase_tests.append(encode_entry({
+                "tdb_jd": tt_jd[i],
+                "body_name": body_name,
+                "phase_angle_deg": pa[i],
+                "fraction_illuminated": fi[i],
+                "obs_to_target_km": u[i],
+                "sun_to_target_km": v[i],
+            }))
+
+        separation_tests.append(encode_entry({
+            "tdb_jd": tt_jd[i],
             "body1": "sun",
             "body2": "moon",
-            "separation_deg": sep_sun_moon,
-        })
+            "separation_deg": sep_sun_moon[i],
+        }))
+
+        elongation_tests.append(encode_entry({
+            "tdb_jd": tt_jd[i],
+            "moon_ecl_lon_deg": moon_ecl_lon[i],
+            "sun_ecl_lon_deg": sun_ecl_lon[i],
+            "elongation_deg": elong[i],
+        }))
+
+
+    shard = {
+        "timescale": timescale_tests,
+        "locations": location_tests,
+        "lunarnodes": lunarnode_tests,
+        "sidereal": sidereal_tests,
+        "era": era_tests,
+        "tdbtt": tdbtt_tests,
+        "phase": phase_tests,
+        "separation": separation_tests,
+        "elongation": elongation_tests,
+        "velocity": velocity_tests,
+        "apparent": apparent_tests,
+        "altaz": altaz_tests,
+    }
+    shard = {key: (len(pieces), b','.join(pieces)) for key, pieces in shard.items()}
+    shard["spk"] = spk_columns
+    shard["ecliptic"] = ecliptic_columns
+    return shard
 
-        # Moon elongation (ecliptic longitude difference Moon - Sun)
-        sun_eclip = sun_astrometric.ecliptic_latlon()
-        moon_eclip = moon_astrometric.ecliptic_latlon()
-        sun_ecl_lon = float(sun_eclip[1]._degrees % 360.0)
-        moon_ecl_lon = float(moon_eclip[1]._degrees % 360.0)
-        elong = (moon_ecl_lon - sun_ecl_lon) % 360.0
-        elongation_tests.append({
-            "tdb_jd": tt_jd,
-            "moon_ecl_lon_deg": moon_ecl_lon,
-            "sun_ecl_lon_deg": sun_ecl_lon,
-            "elongation_deg": float(elong),
-        })
 
-        if (i + 1) % 10000 == 0:
-            print(f"  {i + 1}/{len(dates)} dates processed...")
-
-    print(f"All {len(dates)} dates processed.")
-
-    # --- Tier 1: Refraction (altitude-based, not date-based) ---
-    refraction_tests = []
-    temp_C = 10.0
-    pressure_mbar = 1013.25
-    for alt_deg in [x * 0.5 for x in range(-2, 180)]:  # -1.0 to 89.5 in 0.5° steps
-        r = refraction(alt_deg, temp_C, pressure_mbar)
-        refraction_tests.append({
-            "alt_deg": alt_deg,
-            "temp_c": temp_C,
-            "pressure_mbar": pressure_mbar,
-            "refraction_deg": float(r),
-        })
-    print(f"  Generated {len(refraction_tests)} refraction test cases")
-
-    # Write golden files
-    def write_json(filename, data):
-        path = os.path.join(OUTPUT_DIR, filename)
-        with open(path, 'w') as f:
-            json.dump(data, f, indent=None, separators=(',', ':'))
-        size_mb = os.path.getsize(path) / (1024 * 1024)
-        print(f"  {filename}: {len(data.get('tests', []))} entries, {size_mb:.1f} MB")
-
-    write_json("golden_spk.json", {
-        "ephemeris": "de440s.bsp",
-        "description": "Astrometric (light-time corrected) geocentric positions from Skyfield",
-        "tests": spk_tests,
-    })
-
-    write_json("golden_ecliptic.json", {
-        "description": "Ecliptic lat/lon from Skyfield observe().ecliptic_latlon()",
-        "tests": ecliptic_tests,
-    })
-
-    write_json("golden_timescale.json", {
-        "description": "UTC JD -> TT JD -> UT1 JD from Skyfield",
-        "tests": timescale_tests,
-    })
-
-    write_json("golden_locations.json", {
-        "description": "Ground location ecliptic lat/lon from Skyfield",
-        "tests": location_tests,
-    })
-
-    write_json("golden_lunarnodes.json", {
-        "description": "Mean lunar node longitudes (Meeus formula)",
-        "tests": lunarnode_tests,
-    })
-
-    write_json("golden_sidereal.json", {
-        "description": "GMST from Skyfield (t.gmst * 15 -> degrees)",
-        "tests": sidereal_tests,
-    })
-
-    write_json("golden_era.json", {
-        "description": "Earth Rotation Angle from Skyfield (degrees)",
-        "tests": era_tests,
-    })
-
-    write_json("golden_tdbtt.json", {
-        "description": "TDB-TT from Skyfield tdb_minus_tt() (seconds)",
-        "tests": tdbtt_tests,
-    })
-
-    write_json("golden_phase.json", {
-        "description": "Phase angle and fraction illuminated from Skyfield",
-        "tests": phase_tests,
-    })
-
-    write_json("golden_separation.json", {
-        "description": "Separation angles from Skyfield angle_between()",
-        "tests": separation_tests,
-    })
-
-    write_json("golden_elongation.json", {
-        "description": "Moon elongation (ecliptic longitude difference) from Skyfield",
-        "tests": elongation_tests,
-    })
-
-    write_json("golden_refraction.json", {
-        "description": "Atmospheric refraction from Skyfield Bennett formula",
-        "tests": refraction_tests,
-    })
-
-    write_json("golden_velocity.json", {
-        "description": "Astrometric velocity from Skyfield observe().velocity.km_per_s * 86400 (km/day)",
-        "tests": velocity_tests,
-    })
-
-    write_json("golden_apparent.json", {
-        "description": "Apparent positions from Skyfield observe().apparent().position.km",
-        "tests": apparent_tests,
-    })
-
-    write_json("golden_altaz.json", {
-        "description": "Altitude/azimuth from Skyfield rotation applied to geocentric apparent positions",
-        "tests": altaz_tests,
-    })
+def main():
+    start, day_offsets = generate_dates()
+    workers = os.cpu_count() or 1
+    print(f"Ephemeris: {BSP_PATH}")
+    print(f"Generating golden data for {len(day_offsets)} dates with {workers} worker processes...")
+
+    writers = {
+        # --- Golden SPK data (body positions) ---
+        "spk": JsonColumnsWriter(
+            "golden_spk.json",
+            ephemeris="de440s.bsp",
+            description="Astrometric (light-time corrected) geocentric positions from Skyfield",
+        ),
+        # --- Golden coord data (ecliptic lat/lon) ---
+        "ecliptic": JsonColumnsWriter(
+            "golden_ecliptic.json",
+            description="Ecliptic lat/lon from Skyfield observe().ecliptic_latlon()",
+        ),
+        # --- Golden timescale data ---
+        "timescale": JsonArrayWriter(
+            "golden_timescale.json",
+            description="UTC JD -> TT JD -> UT1 JD from Skyfield",
+        ),
+        # --- Golden location data ---
+        "locations": JsonArrayWriter(
+            "golden_locations.json",
+            description="Ground location ecliptic lat/lon from Skyfield",
+        ),
+        # --- Golden lunar node data ---
+        "lunarnodes": JsonArrayWriter(
+            "golden_lunarnodes.json",
+            description="Mean lunar node longitudes (Meeus formula)",
+        ),
+        # --- Golden sidereal data (GMST) ---
+        "sidereal": JsonArrayWriter(
+            "golden_sidereal.json",
+            description="GMST from Skyfield (t.gmst * 15 -> degrees)",
+        ),
+        # --- Tier 1: ERA, TDB-TT, phase angle, separation, elongation ---
+        "era": JsonArrayWriter(
+            "golden_era.json",
+            description="Earth Rotation Angle from Skyfield (degrees)",
+        ),
+        "tdbtt": JsonArrayWriter(
+            "golden_tdbtt.json",
+            description="TDB-TT from Skyfield tdb_minus_tt() (seconds)",
+        ),
+        "phase": JsonArrayWriter(
+            "golden_phase.json",
+            description="Phase angle and fraction illuminated from Skyfield",
+        ),
+        "separation": JsonArrayWriter(
+            "golden_separation.json",
+            description="Separation angles from Skyfield angle_between()",
+        ),
+        "elongation": JsonArrayWriter(
+            "golden_elongation.json",
+            description="Moon elongation (ecliptic longitude difference) from Skyfield",
+        ),
+        # --- Tier 1: Refraction (altitude-based, not date-based) ---
+        "refraction": JsonArrayWriter(
+            "golden_refraction.json",
+            description="Atmospheric refraction from Skyfield Bennett formula",
+        ),
+        # --- Tier 2: Velocity and apparent positions ---
+        "velocity": JsonArrayWriter(
+            "golden_velocity.json",
+            description="Astrometric velocity from Skyfield observe().velocity.km_per_s * 86400 (km/day)",
+        ),
+        "apparent": JsonArrayWriter(
+            "golden_apparent.json",
+            description="Apparent positions from Skyfield observe().apparent().position.km",
+        ),
+        # --- Tier 2: Altaz (geocentric apparent → altitude/azimuth) ---
+        "altaz": JsonArrayWriter(
+            "golden_altaz.json",
+            description="Altitude/azimuth from Skyfield rotation applied to geocentric apparent positions",
+        ),
+    }
+
+    # Every writer first finishes and syncs its .tmp file; on any failure up
+    # to that point the .tmp files are dropped and no golden file is touched
+    try:
+        # Small contiguous shards, consumed in order, keep every file in date
+        # order while bounding each task's memory by SHARD_DATES
+        shards = [day_offsets[i:i + SHARD_DATES] for i in range(0, len(day_offsets), SHARD_DATES)]
+        with multiprocessing.Pool(workers) as pool:
+            for shard in pool.imap(functools.partial(compute_shard, start), shards):
+                for key, data in shard.items():
+                    if isinstance(data, dict):
+                        writers[key].append_columns(data)
+                    else:
+                        writers[key].append_encoded(*data)
+
+        print(f"All {len(day_offsets)} dates processed.")
+
+        # --- Tier 1: Refraction (altitude-based, not date-based) ---
+        refraction_tests = writers["refraction"]
+        temp_C = 10.0
+        pressure_mbar = 1013.25
+        alt_deg = np.arange(-2, 180) * 0.5  # -1.0 to 89.5 in 0.5° steps
+        refraction_deg = refraction(alt_deg, temp_C, pressure_mbar)
+        for alt, r in zip(alt_deg, refraction_deg):
+            refraction_tests.append({
+                "alt_deg": alt,
+                "temp_c": temp_C,
+                "pressure_mbar": pressure_mbar,
+                "refraction_deg": r,
+            })
+        print(f"  Generated {refraction_tests.count} refraction test cases")
+
+        # Finish golden files
+        for writer in writers.values():
+            writer.close()
+    except BaseException:
+        for writer in writers.values():
+            writer.discard()
+        raise
+
+    # Only once all of them are complete are they moved into place
+    for writer in writers.values():
+        writer.replace()
 
     print("Done.")
 
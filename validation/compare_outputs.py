@@ -1,17 +1,20 @@
-"""Compare Go and Python celestial CSV outputs column by column.
+"""Compare Go and Python celestial outputs column by column.
 
 Usage:
-    python compare_outputs.py [go_csv] [py_csv]
+    python compare_outputs.py [go_output] [py_output]
 
-Defaults to /tmp/planetary_data_go.csv and /tmp/planetary_data_py.csv.
+Defaults to /tmp/planetary_data_go.csv and /tmp/planetary_data_py.parquet.
+Either file may be CSV or Parquet (chosen by the .parquet extension).
 """
 
+import re
 import sys
+import warnings
 import pandas as pd
 import numpy as np
 
 DEFAULT_GO = "/tmp/planetary_data_go.csv"
-DEFAULT_PY = "/tmp/planetary_data_py.csv"
+DEFAULT_PY = "/tmp/planetary_data_py.parquet"
 
 # Column categories for grouped reporting
 PLANETS = {"sun", "moon", "mercury", "venus", "mars", "jupiter", "saturn", "uranus", "neptune", "pluto"}
@@ -20,81 +23,99 @@ SATELLITES = {"fastiss", "issanti", "polesat"}
 LOCATIONS = {"loc_ni", "loc_chicago", "loc_london", "loc_cushing", "loc_ny", "loc_mumbai"}
 NODES = {"north_node_lon_deg", "south_node_lon_deg"}
 
+CATEGORY_BY_PREFIX = {
+    prefix: category
+    for category, prefixes in [
+        ("Planets", PLANETS),
+        ("Galactic Center", GC),
+        ("Satellites", SATELLITES),
+        ("Locations", LOCATIONS),
+    ]
+    for prefix in prefixes
+}
+
+# Strips the coordinate suffix from a column name, e.g. "fastiss_sub_lat_deg" -> "fastiss"
+COORD_SUFFIX = re.compile(r"_(?:sub_)?(?:lat|lon)_deg$")
+
 
 def categorize(col):
-    prefix = col.rsplit("_sub_lat_deg", 1)[0].rsplit("_sub_lon_deg", 1)[0].rsplit("_lat_deg", 1)[0].rsplit("_lon_deg", 1)[0]
-    if prefix in PLANETS:
-        return "Planets"
-    if prefix in GC:
-        return "Galactic Center"
-    if prefix in SATELLITES:
-        return "Satellites"
-    if prefix in LOCATIONS:
-        return "Locations"
     if col in NODES:
         return "Lunar Nodes"
-    return "Other"
+    return CATEGORY_BY_PREFIX.get(COORD_SUFFIX.sub("", col), "Other")
+
+
+def read_output(path):
+    """Read a generator CSV or Parquet file into (columns, times, values).
+
+    Returns the numeric column names, the Time column as UTC datetime64[s] and the remaining columns as a
+    (rows, columns) float64 array. Empty CSV cells (how the Go generator writes NaN) are read as NaN.
+    """
+    if path.endswith(".parquet"):
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path)
+    # CSV stores Time as text and Parquet as a timestamp; align both as UTC instants
+    times = pd.to_datetime(df["Time"], utc=True).dt.tz_convert(None).to_numpy(dtype="datetime64[s]")
+    values = df.drop(columns="Time")
+    return list(values.columns), times, values.to_numpy(dtype=np.float64)
 
 
 def main():
     go_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_GO
     py_path = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_PY
 
-    print(f"Go CSV:     {go_path}")
-    print(f"Python CSV: {py_path}")
+    print(f"Go output:     {go_path}")
+    print(f"Python output: {py_path}")
     print()
 
-    go_df = pd.read_csv(go_path)
-    py_df = pd.read_csv(py_path)
+    go_cols, go_times, go_vals = read_output(go_path)
+    py_cols, py_times, py_vals = read_output(py_path)
 
-    print(f"Go rows: {len(go_df)}, Python rows: {len(py_df)}")
-    print(f"Go columns: {len(go_df.columns)}, Python columns: {len(py_df.columns)}")
+    print(f"Go rows: {len(go_times)}, Python rows: {len(py_times)}")
+    print(f"Go columns: {len(go_cols) + 1}, Python columns: {len(py_cols) + 1}")
     print()
 
     # Align on Time column
-    merged = pd.merge(go_df, py_df, on="Time", suffixes=("_go", "_py"))
-    print(f"Matched rows (by Time): {len(merged)}")
-    print(f"Unmatched Go rows: {len(go_df) - len(merged)}")
-    print(f"Unmatched Py rows: {len(py_df) - len(merged)}")
+    go_idx = pd.Index(go_times).get_indexer(py_times)
+    py_idx = np.flatnonzero(go_idx >= 0)
+    go_idx = go_idx[py_idx]
+    print(f"Matched rows (by Time): {len(py_idx)}")
+    print(f"Unmatched Go rows: {len(go_times) - len(py_idx)}")
+    print(f"Unmatched Py rows: {len(py_times) - len(py_idx)}")
     print()
 
-    if len(merged) == 0:
+    if len(py_idx) == 0:
         print("ERROR: No matching timestamps. Check Time column format.")
         sys.exit(1)
 
     # Find common numeric columns (exclude Time)
-    go_cols = set(c.replace("_go", "") for c in merged.columns if c.endswith("_go"))
-    py_cols = set(c.replace("_py", "") for c in merged.columns if c.endswith("_py"))
-    common = sorted(go_cols & py_cols)
+    common = sorted(set(go_cols) & set(py_cols))
 
-    go_only = go_cols - py_cols
-    py_only = py_cols - go_cols
+    go_only = set(go_cols) - set(py_cols)
+    py_only = set(py_cols) - set(go_cols)
     if go_only:
         print(f"Columns only in Go: {sorted(go_only)}")
     if py_only:
         print(f"Columns only in Python: {sorted(py_only)}")
 
-    # Per-column errors
-    results = []
-    for col in common:
-        go_vals = pd.to_numeric(merged[col + "_go"], errors="coerce")
-        py_vals = pd.to_numeric(merged[col + "_py"], errors="coerce")
-
-        # Skip rows where either is NaN
-        mask = go_vals.notna() & py_vals.notna()
-        if mask.sum() == 0:
-            results.append((col, categorize(col), 0, np.nan, np.nan, np.nan))
-            continue
-
-        diff = (go_vals[mask] - py_vals[mask]).abs()
-        results.append((
-            col,
-            categorize(col),
-            int(mask.sum()),
-            diff.max(),
-            diff.mean(),
-            diff.median(),
-        ))
+    # Absolute errors for every matched row and common column in one pass
+    go_col_idx = [go_cols.index(c) for c in common]
+    py_col_idx = [py_cols.index(c) for c in common]
+    diff = np.abs(go_vals[np.ix_(go_idx, go_col_idx)] - py_vals[np.ix_(py_idx, py_col_idx)])
+
+    # Per-column errors, skipping rows where either side is NaN. Columns with
+    # no valid rows come out as NaN, so silence the all-NaN slice warnings.
+    counts = np.count_nonzero(~np.isnan(diff), axis=0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        maxes = np.nanmax(diff, axis=0)
+        means = np.nanmean(diff, axis=0)
+        medians = np.nanmedian(diff, axis=0)
+
+    results = [
+        (col, categorize(col), n, mx, mn, md)
+        for col, n, mx, mn, md in zip(common, counts, maxes, means, medians)
+    ]
 
     # Print per-column detail
     print(f"\n{'='*90}")
@@ -1,6 +1,11 @@
-import pandas as pd
 import numpy as np
 from skyfield.api import load
+from skyfield.constants import AU_KM, DAY_S, tau
+from skyfield.framelib import itrs
+from skyfield.functions import mxv
+from skyfield.positionlib import Geocentric
+from skyfield.sgp4lib import TEME
+from skyfield.toposlib import iers2010
 import locations
 import satellites
 import lunar_nodes
@@ -26,6 +31,14 @@ def get_bodies():
     }
     return bodies
 
+# Resolved once at import rather than per batch
+bodies_to_add = tuple(get_bodies().items())
+
+# Sgr A* is defined without proper motion or parallax, so its astrometric
+# direction from Earth does not change over time; observe it once and
+# broadcast it instead of running observe() over every timestamp
+gc_ecliptic = locations.earth.at(timescl.J2000).observe(GalacticCenter).ecliptic_latlon()
+
 locations_to_add = {
     'loc_ni': locations.NULL_ISLAND_loc,
     'loc_chicago': locations.CHICAGO_loc,
@@ -34,47 +47,102 @@ locations_to_add = {
     'loc_ny': locations.NY_loc,
     'loc_mumbai': locations.MUMBAI_loc,
 }
+# Each *_loc is earth + wgs84.latlon(...); stack the fixed ITRS vectors of
+# the surface points as the columns of one (3, locations) matrix
+location_itrs_au = np.stack([loc.vector_functions[-1].itrs_xyz.au
+                             for loc in locations_to_add.values()], axis=1)
+
+def radians_to_degrees(radians, out):
+    # Same arithmetic as Skyfield's Angle.degrees, written into a preallocated
+    # buffer instead of allocating new arrays
+    np.multiply(radians, 360.0, out=out)
+    return np.divide(out, tau, out=out)
 
-# Add celestial details to a dataframe
-def get_celestial_df(timeSeries, addSatellites):
+# Compute celestial details for a series of UTC times, as a dict of columns
+def get_celestial_data(timeSeries, addSatellites):
     addLocations=True
 
-    df = pd.DataFrame()
-    df["Time"] = timeSeries
-    tobjs = timescl.from_datetimes(df.Time)
+    # Build the Time from the UTC calendar components of every row: one
+    # vectorized call instead of converting each datetime in Python. Seconds
+    # keep their fractional part, as from_datetimes() did.
+    dt = timeSeries.dt
+    seconds = dt.second.to_numpy() + dt.microsecond.to_numpy() / 1e6 + dt.nanosecond.to_numpy() / 1e9
+    tobjs = timescl.utc(dt.year.to_numpy(), dt.month.to_numpy(), dt.day.to_numpy(),
+                        dt.hour.to_numpy(), dt.minute.to_numpy(), seconds)
     sun = locations.ephem['sun']
     earth = locations.ephem['earth']
-    bodies = get_bodies()
+
+    # Earth's state at tobjs is the same for every target (bodies and
+    # locations), so compute it once
+    earth_at = earth.at(tobjs)
+
+    # Latitude/longitude rows for every body, satellite and location, in
+    # output column order. Longitudes (with the two lunar node rows appended)
+    # are wrapped to [0, 360) in a single pass at the end.
+    row_keys = [(name.lower()+"_lat_deg", name.lower()+"_lon_deg") for name, body in bodies_to_add]
+    if addSatellites:
+        row_keys += [(name.lower()+"_sub_lat_deg", name.lower()+"_sub_lon_deg") for name in satellites.artisats]
+    if addLocations:
+        row_keys += [(name.lower()+"_lat_deg", name.lower()+"_lon_deg") for name in locations_to_add]
+    lats = np.empty((len(row_keys), len(timeSeries)))
+    lons = np.empty((len(row_keys) + 2, len(timeSeries)))
+    row = 0
 
     # Add geocentric positions for each body
-    for body_name, body in bodies.items():
-        keyprefix = body_name.lower()
-        obs = earth.at(tobjs).observe(body)
-         # We could switch to RA/Dec if that improves. This works for now.
-        eclip = obs.ecliptic_latlon()
-        df[keyprefix+"_lat_deg"] = eclip[0].degrees
-        df[keyprefix+"_lon_deg"] = eclip[1]._degrees % 360.0
+    for body_name, body in bodies_to_add:
+        if body is GalacticCenter:
+            eclip = gc_ecliptic
+        else:
+            obs = earth_at.observe(body)
+             # We could switch to RA/Dec if that improves. This works for now.
+            eclip = obs.ecliptic_latlon()
+        radians_to_degrees(eclip[0].radians, out=lats[row])
+        radians_to_degrees(eclip[1].radians, out=lons[row])
+        row += 1
 
     if addSatellites:
-        # Add positions for satellites
-        for body_name, sat in satellites.artisats.items():
-            keyprefix = body_name.lower()
-            subpoint = sat.at(tobjs).subpoint()
-            df[keyprefix+"_sub_lat_deg"] = subpoint.latitude.degrees
-            df[keyprefix+"_sub_lon_deg"] = subpoint.longitude.degrees % 360.0
-
-    
+        # Add positions for satellites. All of them are propagated in one SGP4
+        # call at the UTC Julian dates, split exactly as
+        # EarthSatellite._position_and_velocity_TEME_km does (sgp4.api.jday
+        # would treat 2100 as a leap year); r is (satellites, times, 3) km in TEME.
+        jd = tobjs.whole
+        fr = tobjs.tai_fraction - tobjs._leap_seconds() / DAY_S
+        _, r, _ = satellites.artisats_array.sgp4(jd, fr)
+        # TEME -> GCRS for every satellite at once, as EarthSatellite.at() does
+        R = np.swapaxes(TEME.rotation_at(tobjs), 0, 1)
+        r_gcrs = mxv(R, np.moveaxis(r, 2, 0) / AU_KM)
+        for i in range(len(satellites.artisats)):
+            # Same ellipsoid as the deprecated position.subpoint()
+            lat, lon = iers2010.latlon_of(Geocentric(r_gcrs[:, i], t=tobjs))
+            radians_to_degrees(lat.radians, out=lats[row])
+            radians_to_degrees(lon.radians, out=lons[row])
+            row += 1
+
     if addLocations:
-        for loc_name, loc in locations_to_add.items():
-            keyprefix = loc_name.lower()
-            obs = earth.at(tobjs).observe(loc)
+        # Ground locations are fixed in ITRS, so their geocentric GCRS position is
+        # just the ITRS -> GCRS rotation (shared by all locations) applied to a
+        # constant vector. This is the geometric position at tobjs, which is what
+        # coord.GeodeticToICRF computes on the Go side; observe() would instead
+        # apply light-time and aberration, re-evaluating nutation per iteration.
+        # Rotating the stacked vectors gives (3, locations, times) in one call.
+        RT = np.swapaxes(itrs.rotation_at(tobjs), 0, 1)
+        r_gcrs = np.einsum('ijk,jl->ilk', RT, location_itrs_au)
+        for i in range(len(locations_to_add)):
+            obs = Geocentric(r_gcrs[:, i], t=tobjs)
             eclip = obs.ecliptic_latlon()
-            df[keyprefix+"_lat_deg"] = eclip[0].degrees
-            df[keyprefix+"_lon_deg"] = eclip[1]._degrees % 360.0
+            radians_to_degrees(eclip[0].radians, out=lats[row])
+            radians_to_degrees(eclip[1].radians, out=lons[row])
+            row += 1
 
-    north_node_lon, south_node_lon = lunar_nodes.mean_lunar_nodes(tobjs)
-    df["north_node_lon_deg"] = north_node_lon % 360.0
-    df["south_node_lon_deg"] = south_node_lon % 360.0
+    lons[row], lons[row + 1] = lunar_nodes.mean_lunar_nodes(tobjs)
+    np.mod(lons, 360.0, out=lons)
 
-    return df
+    # Columns are collected in a dict, in output order
+    data = {"Time": timeSeries}
+    for i, (lat_key, lon_key) in enumerate(row_keys):
+        data[lat_key] = lats[i]
+        data[lon_key] = lons[i]
+    data["north_node_lon_deg"] = lons[row]
+    data["south_node_lon_deg"] = lons[row + 1]
 
+    return data
@@ -1,3 +1,4 @@
+import numpy as np
 
 # ------------------------------------------------------
 # Mean lunar node longitude
@@ -8,13 +9,16 @@ def mean_lunar_node_longitude(time):
     jd_tt = time.tt  # Skyfield's 'time.tt' => Julian Date in Terrestrial Time
     T = (jd_tt - 2451545.0) / 36525.0
 
-    omega = (
-        125.04452
-        - 1934.136261 * T
-        + 0.0020708 * (T**2)
-        + (T**3) / 450000.0
-    )
-    return omega % 360.0
+    # 125.04452 - 1934.136261 T + 0.0020708 T^2 + T^3 / 450000, in Horner
+    # form and updated in place so no T**2 / T**3 temporaries are allocated.
+    # The final np.mod has no out= so a scalar Time still gives a float.
+    omega = T / 450000.0
+    omega += 0.0020708
+    omega *= T
+    omega -= 1934.136261
+    omega *= T
+    omega += 125.04452
+    return np.mod(omega, 360.0)
 
 # ------------------------------------------------------
 # Mean lunar nodes
@@ -1,38 +1,72 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import celestial
 from tqdm import tqdm
-import os
-import pytz
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
+# Each worker holds one batch (~2.5 GB peak, see below), so the worker count
+# is what bounds memory; override with `python main.py <workers>`
+DEFAULT_WORKERS = 2
 
-def create_batch_processed_planetary_df(input_df, output_file_name):
+def compute_batch(timeSeries):
+    # Runs in a worker process; celestial's module-level ephemeris, timescale
+    # and satellites are loaded once per worker on import
+    return celestial.get_celestial_data(timeSeries, addSatellites=True)
+
+def create_batch_processed_planetary_df(input_df, output_file_name, max_workers=DEFAULT_WORKERS):
+    # Each batch is evaluated as one array-valued Time. Skyfield's IAU 2000A
+    # nutation allocates (678, rows) arrays, so a 100k-row batch already peaks
+    # around 2.5 GB; the full range in one call would not fit in memory.
     batch_size = 100000
     num_batches = len(input_df) // batch_size + (1 if len(input_df) % batch_size != 0 else 0)
     output_file = output_file_name
+    # Drop any previous output up front so a run that fails before the first
+    # batch is written can't leave a stale file for compare_outputs.py
     os.remove(output_file) if os.path.exists(output_file) else None
-    for i in tqdm(range(num_batches)):
-        batch_df = input_df.iloc[i * batch_size:(i + 1) * batch_size]
-        result_df = celestial.get_celestial_df(batch_df["Time"], addSatellites=True)
-
-        result_df.to_csv(output_file, mode='a', header=not i, index=False)
+    batches = [input_df["Time"].iloc[i * batch_size:(i + 1) * batch_size] for i in range(num_batches)]
+    # Batches are computed in up to max_workers parallel worker processes
+    # (each peaking at the memory noted above); map() yields them in order,
+    # and each is appended to the Parquet file as a row group
+    writer = None
+    try:
+        with ProcessPoolExecutor(max_workers=min(max_workers, os.cpu_count() or 1)) as ex:
+            for data in tqdm(ex.map(compute_batch, batches), total=num_batches):
+                table = pa.Table.from_pydict(data)
+                if writer is None:
+                    writer = pq.ParquetWriter(output_file, table.schema, compression='zstd')
+                writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
 
 def get_dates_df(startDate, endDate):
-    startDateStr = startDate.date().isoformat()
-    endDateStr = endDate.date().isoformat()
+    # Hourly from startDate's midnight through endDate's midnight (inclusive),
+    # built as one datetime64 arange instead of parsing dates in pd.date_range
+    hour = np.timedelta64(1, 'h')
+    start = np.datetime64(startDate.date(), 'ns')
+    end = np.datetime64(endDate.date(), 'ns') + hour
     df = pd.DataFrame()
-    df["Time"] = pd.date_range(start=startDateStr, end=endDateStr, freq='1h',tz='UTC')
+    df["Time"] = pd.DatetimeIndex(np.arange(start, end, hour), tz='UTC')
     return df
 
 def main():
-    referenceDate = datetime(2026, 1, 19, tzinfo=pytz.UTC)
+    workers = sys.argv[1] if len(sys.argv) > 1 else str(DEFAULT_WORKERS)
+    if not workers.isdigit() or int(workers) < 1:
+        sys.exit(f"usage: python main.py [workers]  (workers must be a positive integer, got {workers!r})")
+    workers = int(workers)
+    referenceDate = datetime(2026, 1, 19, tzinfo=timezone.utc)
     pastDate = referenceDate + timedelta(days=-100*365) # ±100 years
     futureDate = referenceDate + timedelta(days=100*365) # ±100 years
     
     df = get_dates_df(pastDate, futureDate)
     print(df)
 
-    create_batch_processed_planetary_df(df,"/tmp/planetary_data_py.csv")
+    create_batch_processed_planetary_df(df,"/tmp/planetary_data_py.parquet", workers)
 
 if __name__ == "__main__":
     main()
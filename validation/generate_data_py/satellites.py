@@ -1,3 +1,4 @@
+from sgp4.api import SatrecArray
 from skyfield.api import load, Angle, Star, EarthSatellite
 tscale = load.timescale()
 
@@ -29,4 +30,8 @@ artisats = {
     "FastISS": iss_fast,
     "ISSAnti": iss_anti,
     "PoleSAT": pole_sat,
-}
\ No newline at end of file
+}
+
+# All of the above as one SGP4 array, in artisats order, so they can be
+# propagated together in a single call
+artisats_array = SatrecArray([sat.model for sat in artisats.values()])